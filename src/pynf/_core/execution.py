@@ -18,6 +18,7 @@ import logging
 import os
 from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -70,28 +71,38 @@ def configure_logging(verbose: bool) -> None:
         return
 
     try:
-        logger_factory = jpype.JClass("org.slf4j.LoggerFactory")
-        level_cls = jpype.JClass("ch.qos.logback.classic.Level")
-        context = logger_factory.getILoggerFactory()
-        root_logger = context.getLogger("ROOT")
-        root_logger.setLevel(level_cls.WARN)
+        level_cls = java_class("ch.qos.logback.classic.Level")
+        _logback_root_logger().setLevel(level_cls.WARN)
     except Exception:
         return
 
 
+@lru_cache(maxsize=1)
+def _logback_root_logger() -> Any:
+    # The logback context is a JVM-wide singleton, so its root logger is too.
+    logger_factory = java_class("org.slf4j.LoggerFactory")
+    return logger_factory.getILoggerFactory().getLogger("ROOT")
+
+
 def start_jvm_if_needed(jar_path: Path) -> None:
     """Start the JVM with the Nextflow JAR on the classpath."""
     if not jpype.isJVMStarted():
         jpype.startJVM(classpath=[str(jar_path)])
 
 
+@lru_cache(maxsize=None)
+def java_class(name: str) -> Any:
+    """Resolve a Java class once per process (the JVM must already be running)."""
+    return jpype.JClass(name)
+
+
 def load_nextflow_classes() -> dict[str, Any]:
     """Load the Nextflow Java classes required by the runtime."""
     return {
-        "ScriptLoaderFactory": jpype.JClass("nextflow.script.ScriptLoaderFactory"),
-        "Session": jpype.JClass("nextflow.Session"),
-        "TraceObserverV2": jpype.JClass("nextflow.trace.TraceObserverV2"),
-        "ScriptMeta": jpype.JClass("nextflow.script.ScriptMeta"),
+        "ScriptLoaderFactory": java_class("nextflow.script.ScriptLoaderFactory"),
+        "Session": java_class("nextflow.Session"),
+        "TraceObserverV2": java_class("nextflow.trace.TraceObserverV2"),
+        "ScriptMeta": java_class("nextflow.script.ScriptMeta"),
     }
 
 
@@ -100,6 +111,10 @@ def to_java(value: Any, *, param_type: str | None = None) -> Any:
     if value is None:
         return None
 
+    # Already a Java object (e.g. a value reused from a previous run).
+    if isinstance(value, jpype.JObject):
+        return value
+
     if isinstance(value, Path):
         return str(value)
 
@@ -107,14 +122,14 @@ def to_java(value: Any, *, param_type: str | None = None) -> Any:
         return value
 
     if isinstance(value, Mapping):
-        HashMap = jpype.JClass("java.util.HashMap")
+        HashMap = java_class("java.util.HashMap")
         m = HashMap()
         for k, v in value.items():
             m.put(str(k), to_java(v))
         return m
 
     if isinstance(value, (list, tuple, set)):
-        ArrayList = jpype.JClass("java.util.ArrayList")
+        ArrayList = java_class("java.util.ArrayList")
         arr = ArrayList()
         for item in value:
             arr.add(to_java(item, param_type=param_type))
@@ -123,6 +138,10 @@ def to_java(value: Any, *, param_type: str | None = None) -> Any:
     return value
 
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
 class WorkflowOutputCollector:
     """Collect workflow outputs, file publish events, and task workdirs."""
 
@@ -158,26 +177,22 @@ class WorkflowOutputCollector:
     def __getattr__(self, name: str):
         # Nextflow TraceObserverV2 has many callback methods; we only care about a few.
         if name.startswith("on"):
-            def _noop(*args: Any, **kwargs: Any) -> None:
-                return None
-
             return _noop
         raise AttributeError(name)
 
-    def workflow_events(self) -> list[dict]:
-        return list(self._workflow_events)
+    def workflow_events(self) -> tuple[dict, ...]:
+        return tuple(self._workflow_events)
 
-    def file_events(self) -> list[dict]:
-        return list(self._file_events)
+    def file_events(self) -> tuple[dict, ...]:
+        return tuple(self._file_events)
 
-    def task_workdirs(self) -> list[str]:
-        return list(self._task_workdirs)
+    def task_workdirs(self) -> tuple[str, ...]:
+        return tuple(self._task_workdirs)
 
     def _record_task_workdir(self, event: Any) -> None:
+        # Keep only the workdir string, not the event and the task graph behind it.
         try:
-            handler = event.getHandler()
-            task = handler.getTask()
-            self._task_workdirs.append(str(task.getWorkDir()))
+            self._task_workdirs.append(str(event.getHandler().getTask().getWorkDir()))
         except Exception:
             return
 
@@ -187,7 +202,9 @@ def get_process_inputs(script_loader: Any, script: Any, script_meta_cls: Any) ->
     script_loader.setModule(True)
 
     script_meta = script_meta_cls.get(script)
-    process_names = script_meta.getProcessNames()
+    # Copy the Java set out in one toArray() call; the emptiness check and the
+    # loop below then stay on the Python side.
+    process_names = list(script_meta.getProcessNames().toArray())
 
     if not process_names:
         was_module = script_meta.isModule()
@@ -196,7 +213,7 @@ def get_process_inputs(script_loader: Any, script: Any, script_meta_cls: Any) ->
             script_loader.runScript()
         finally:
             script_meta.setModule(was_module)
-        process_names = script_meta.getProcessNames()
+        process_names = list(script_meta.getProcessNames().toArray())
 
     if not process_names:
         return []
@@ -210,26 +227,27 @@ def get_process_inputs(script_loader: Any, script: Any, script_meta_cls: Any) ->
 
 
 def _extract_process_inputs(process_def: Any) -> list[dict]:
-    process_config = process_def.getProcessConfig()
-    inputs = process_config.getInputs()
+    # toArray() copies the Java list out in one call instead of one bridge
+    # round trip per element while iterating.
+    inputs = process_def.getProcessConfig().getInputs().toArray()
     return [_build_channel_info(inp) for inp in inputs]
 
 
 def _build_channel_info(input_def: Any) -> dict:
-    channel_info = {"type": str(input_def.getTypeName()), "params": []}
+    # Each Java getter is a bridge round trip, so call every one only once.
+    type_name = str(input_def.getTypeName())
+    get_inner = getattr(input_def, "getInner", None)
+    inner = get_inner() if get_inner is not None else None
 
-    if hasattr(input_def, "getInner") and input_def.getInner() is not None:
-        inner = input_def.getInner()
-        channel_info["params"] = [
+    if inner is not None:
+        params = [
             {"type": str(component.getTypeName()), "name": str(component.getName())}
-            for component in inner
+            for component in inner.toArray()
         ]
     else:
-        channel_info["params"].append(
-            {"type": str(input_def.getTypeName()), "name": str(input_def.getName())}
-        )
+        params = [{"type": type_name, "name": str(input_def.getName())}]
 
-    return channel_info
+    return {"type": type_name, "params": params}
 
 
 @contextmanager
@@ -237,9 +255,9 @@ def managed_session(Session: Any, script_path: str) -> Iterator[Any]:
     """Create, initialize, start, and always destroy a Nextflow session."""
     session = Session()
 
-    ArrayList = jpype.JClass("java.util.ArrayList")
-    ScriptFile = jpype.JClass("nextflow.script.ScriptFile")
-    script_file = ScriptFile(jpype.java.nio.file.Paths.get(script_path))
+    ArrayList = java_class("java.util.ArrayList")
+    ScriptFile = java_class("nextflow.script.ScriptFile")
+    script_file = ScriptFile(java_class("java.nio.file.Paths").get(script_path))
 
     session.init(script_file, ArrayList(), None, None)
     session.start()
@@ -258,9 +276,7 @@ def registered_trace_observer(session: Any, observer_proxy: Any) -> Iterator[Non
     """Register a TraceObserverV2 instance on a session (best-effort removal)."""
     observers = None
     try:
-        field = session.getClass().getDeclaredField("observersV2")
-        field.setAccessible(True)
-        observers = field.get(session)
+        observers = _observers_field(session.getClass()).get(session)
         observers.add(observer_proxy)
         yield
     finally:
@@ -272,6 +288,14 @@ def registered_trace_observer(session: Any, observer_proxy: Any) -> Iterator[Non
             pass
 
 
+@lru_cache(maxsize=None)
+def _observers_field(session_cls: Any) -> Any:
+    # Reflective lookup + setAccessible once per Session class, not per run.
+    field = session_cls.getDeclaredField("observersV2")
+    field.setAccessible(True)
+    return field
+
+
 def execute_nextflow(request: ExecutionRequest, nextflow_jar_path: str | None = None) -> NextflowResult:
     """Execute a Nextflow script and capture structured runtime outputs."""
     jar_path = resolve_nextflow_jar_path(nextflow_jar_path)
@@ -294,7 +318,7 @@ def execute_nextflow(request: ExecutionRequest, nextflow_jar_path: str | None =
                 session.getBinding().setVariable(key, value)
 
         loader = ScriptLoaderFactory.create(session)
-        java_path = jpype.java.nio.file.Paths.get(str(request.script_path))
+        java_path = java_class("java.nio.file.Paths").get(str(request.script_path))
         loader.parse(java_path)
         script = loader.getScript()
 
@@ -314,6 +338,9 @@ def execute_nextflow(request: ExecutionRequest, nextflow_jar_path: str | None =
             session.await_()
 
         # Snapshot values before session teardown.
+        workflow_events = collector.workflow_events()
+        file_events = collector.file_events()
+        task_workdirs = collector.task_workdirs()
         work_dir = str(session.getWorkDir())
         stats = session.getStatsObserver().getStats()
         report = {
@@ -323,9 +350,9 @@ def execute_nextflow(request: ExecutionRequest, nextflow_jar_path: str | None =
         }
 
     return NextflowResult(
-        workflow_events=collector.workflow_events(),
-        file_events=collector.file_events(),
-        task_workdirs=collector.task_workdirs(),
+        workflow_events=workflow_events,
+        file_events=file_events,
+        task_workdirs=task_workdirs,
         execution_report=report,
         work_dir=work_dir,
     )
@@ -333,7 +360,7 @@ def execute_nextflow(request: ExecutionRequest, nextflow_jar_path: str | None =
 
 def _configure_docker(session: Any, docker_config: DockerConfig) -> None:
     """Apply Docker configuration to the Nextflow session config."""
-    HashMap = jpype.JClass("java.util.HashMap")
+    HashMap = java_class("java.util.HashMap")
     config = session.getConfig()
 
     if not config.containsKey("docker"):
@@ -2,9 +2,46 @@
 
 from __future__ import annotations
 
+import os
+import secrets
+import shutil
+from functools import cache
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds for every GitHub request.
+REQUEST_TIMEOUT = (3.05, 30)
+USER_AGENT = "pynf"
+
+
+
+@cache
+def get_session() -> requests.Session:
+    """Return the shared HTTP session used for GitHub requests.
+
+    Reusing one session keeps connections to ``api.github.com`` and
+    ``raw.githubusercontent.com`` alive across calls instead of paying a new
+    TCP+TLS handshake per file.
+
+    Returns:
+        A process-wide ``requests.Session`` with pooling and retries configured.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def _auth_headers(github_token: str | None) -> dict[str, str]:
@@ -44,42 +81,172 @@ def fetch_directory_entries(
         >>> fetch_directory_entries("https://api.github.com/...", None)
         [{'name': 'fastqc', 'type': 'dir'}]
     """
+    entries, _ = fetch_directory_entries_if_modified(api_url, github_token, None)
+    return entries or []
+
+
+def fetch_directory_entries_if_modified(
+    api_url: str,
+    github_token: str | None,
+    etag: str | None,
+) -> tuple[list[dict[str, Any]] | None, str | None]:
+    """Fetch directory entries unless they match a previously seen ETag.
+
+    GitHub answers ``304 Not Modified`` to a matching ``If-None-Match`` header,
+    and such responses do not count against the API rate limit.
+
+    Args:
+        api_url: GitHub API URL for the target directory.
+        github_token: Optional GitHub token for authenticated requests.
+        etag: ETag from a previous response, or ``None`` for an unconditional fetch.
+
+    Returns:
+        ``(entries, etag)``. ``entries`` is ``None`` when the listing is unchanged.
+
+    Raises:
+        ValueError: If the GitHub API request fails.
+
+    Example:
+        >>> fetch_directory_entries_if_modified("https://api.github.com/...", None, 'W/"abc"')
+        (None, 'W/"abc"')
+    """
+    data, new_etag = _get_json_if_modified(
+        f"{api_url}?per_page=100", github_token, etag
+    )
+    if data is None:
+        return None, new_etag
+    if not isinstance(data, list):
+        return [], new_etag
+    return data, new_etag
+
+
+def fetch_repo_tree_if_modified(
+    repo: str,
+    ref: str,
+    github_token: str | None,
+    etag: str | None,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Fetch a repository's whole Git tree in a single request.
+
+    Uses ``GET /repos/{repo}/git/trees/{ref}?recursive=1``. GitHub sets
+    ``truncated`` in the payload when the tree is too large to return at once.
+
+    Args:
+        repo: Repository in ``owner/name`` form.
+        ref: Branch, tag, or tree SHA.
+        github_token: Optional GitHub token for authenticated requests.
+        etag: ETag from a previous response, or ``None`` for an unconditional fetch.
+
+    Returns:
+        ``(tree, etag)``. ``tree`` is ``None`` when the tree is unchanged.
+
+    Raises:
+        ValueError: If the GitHub API request fails.
+
+    Example:
+        >>> fetch_repo_tree_if_modified("nf-core/modules", "master", None, None)
+        ({'sha': '...', 'tree': [...], 'truncated': False}, 'W/"abc"')
+    """
+    data, new_etag = _get_json_if_modified(
+        f"https://api.github.com/repos/{repo}/git/trees/{ref}?recursive=1",
+        github_token,
+        etag,
+    )
+    if data is None:
+        return None, new_etag
+    if not isinstance(data, dict):
+        return {"tree": [], "truncated": True}, new_etag
+    return data, new_etag
+
+
+def _get_json_if_modified(
+    url: str, github_token: str | None, etag: str | None
+) -> tuple[Any, str | None]:
+    headers = _auth_headers(github_token)
+    if etag:
+        headers["If-None-Match"] = etag
+
     try:
-        response = requests.get(
-            f"{api_url}?per_page=100", headers=_auth_headers(github_token)
-        )
+        response = get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            return None, etag
         response.raise_for_status()
     except requests.RequestException as exc:
         raise ValueError(f"Failed to fetch from GitHub API: {exc}") from exc
 
-    data = response.json()
-    if not isinstance(data, list):
-        return []
-    return data
+    return response.json(), response.headers.get("ETag")
+
 
+def download_raw_file(
+    raw_url: str, dest: Path, github_token: str | None = None
+) -> None:
+    """Stream a raw file's bytes straight to disk.
 
-def fetch_raw_text(raw_url: str, github_token: str | None = None) -> str:
-    """Fetch a raw file's text content.
+    The body is copied in 64 KiB chunks, so memory stays flat regardless of the
+    file size and no decode/encode round trip happens. Bytes go to a temporary
+    file next to ``dest`` that is renamed into place once complete, so an
+    interrupted download never leaves a truncated ``dest`` behind.
 
     Args:
         raw_url: Raw GitHub URL for the file.
+        dest: Destination path on disk.
         github_token: Optional GitHub token for authenticated requests.
 
-    Returns:
-        Text content of the remote file.
-
     Raises:
         ValueError: If the file does not exist or the request fails.
 
     Example:
-        >>> fetch_raw_text("https://raw.githubusercontent.com/.../meta.yml")
-        'contents of meta.yml'
+        >>> download_raw_file("https://raw.githubusercontent.com/.../main.nf", Path("main.nf"))
+    """
+    with get_session().get(
+        raw_url,
+        headers=_auth_headers(github_token),
+        timeout=REQUEST_TIMEOUT,
+        stream=True,
+    ) as response:
+        if response.status_code == 404:
+            raise ValueError(f"Module file not found: {raw_url}")
+        response.raise_for_status()
+        response.raw.decode_content = True
+        fd, tmp_path = _create_temp_beside(dest)
+        try:
+            with open(fd, "wb", buffering=1 << 20) as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 16)
+            os.replace(tmp_path, dest)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def atomic_write_text(path: str | Path, text: str) -> None:
+    """Replace a file's contents through a temporary file and a rename.
+
+    Concurrent readers see either the old or the new file, never a truncated
+    one. No fsync: cached files can always be rebuilt.
+
+    Args:
+        path: Destination path on disk.
+        text: Full text content to write.
+
+    Example:
+        >>> atomic_write_text(Path("etags.json"), "{}")
     """
-    response = requests.get(raw_url, headers=_auth_headers(github_token))
-    if response.status_code == 404:
-        raise ValueError(f"Module file not found: {raw_url}")
-    response.raise_for_status()
-    return response.text
+    fd, tmp_path = _create_temp_beside(path)
+    try:
+        with open(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _create_temp_beside(path: str | Path) -> tuple[int, str]:
+    # Unlike mkstemp (always 0600), an exclusive os.open with 0o666 lets the
+    # kernel apply the current umask, so cache files get the usual mode.
+    directory, name = os.path.split(path)
+    tmp_path = os.path.join(directory, f".{name}.{secrets.token_hex(8)}")
+    return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
 
 
 def fetch_rate_limit(github_token: str | None) -> dict[str, Any]:
@@ -99,8 +266,10 @@ def fetch_rate_limit(github_token: str | None) -> dict[str, Any]:
         {'limit': 60, 'remaining': 59, 'reset_time': 1700000000}
     """
     try:
-        response = requests.get(
-            "https://api.github.com/rate_limit", headers=_auth_headers(github_token)
+        response = get_session().get(
+            "https://api.github.com/rate_limit",
+            headers=_auth_headers(github_token),
+            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
     except requests.RequestException as exc:
@@ -18,26 +18,49 @@ The optional ``nf-core/`` prefix is accepted and ignored at the boundary.
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Sequence
 
-import jpype
-import yaml
-
-from .github_api import fetch_directory_entries, fetch_raw_text, fetch_rate_limit
+from .github_api import (
+    atomic_write_text,
+    download_raw_file,
+    fetch_directory_entries,
+    fetch_directory_entries_if_modified,
+    fetch_rate_limit,
+    fetch_repo_tree_if_modified,
+)
 from .types import ExecutionRequest, ModuleId, ModulePaths
 from .execution import (
     assert_nextflow_jar_exists,
     execute_nextflow,
     get_process_inputs,
+    java_class,
     load_nextflow_classes,
+    managed_session,
     resolve_nextflow_jar_path,
     start_jvm_if_needed,
 )
 
+MODULES_REPO = "nf-core/modules"
+MODULES_REF = "master"
+MODULES_TREE_PREFIX = "modules/nf-core/"
 API_BASE = "https://api.github.com/repos/nf-core/modules/contents/modules/nf-core"
 RAW_BASE = "https://raw.githubusercontent.com/nf-core/modules/master/modules/nf-core"
+_RAW_PREFIX = RAW_BASE + "/"
 MODULES_LIST_FILENAME = "modules_list.txt"
+ETAGS_FILENAME = "etags.json"
+CATALOG_TTL_SECONDS = 600.0
+CATALOG_MAX_AGE_SECONDS = 3600.0
+RATE_LIMIT_TTL_SECONDS = 30.0
 
 
 def normalize_module_id(module_id: str) -> ModuleId:
@@ -68,57 +91,124 @@ def ensure_cache_dir(cache_dir: Path) -> Path:
 
 def modules_list_path(cache_dir: Path) -> Path:
     """Return the cached modules list path, creating the cache dir if needed."""
-    return ensure_cache_dir(cache_dir) / MODULES_LIST_FILENAME
+    ensure_cache_dir(cache_dir)
+    return _modules_list_path_cached(str(cache_dir))
 
 
 def read_cached_modules_list(cache_dir: Path) -> list[ModuleId]:
     """Read cached module identifiers from disk (or return empty)."""
-    path = modules_list_path(cache_dir)
-    if not path.exists():
+    try:
+        with open(modules_list_path(cache_dir), "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
         return []
-    return [line.strip() for line in path.read_text().splitlines() if line.strip()]
+    # Module ids never contain whitespace, so one C-level split strips every
+    # line and drops blank ones in a single pass.
+    return data.decode().split()
 
 
 def write_cached_modules_list(cache_dir: Path, modules: Sequence[ModuleId]) -> None:
     """Write module identifiers to the cache file."""
-    path = modules_list_path(cache_dir)
-    path.write_text("\n".join(modules) + ("\n" if modules else ""))
+    atomic_write_text(
+        modules_list_path(cache_dir), "".join(f"{module}\n" for module in modules)
+    )
 
 
 def module_paths(cache_dir: Path, module_id: str) -> ModulePaths:
     """Return canonical local paths for a cached module."""
-    module_id = normalize_module_id(module_id)
-    directory = ensure_cache_dir(cache_dir) / module_id
-    return ModulePaths(
-        module_id=module_id,
-        module_dir=directory,
-        main_nf=directory / "main.nf",
-        meta_yml=directory / "meta.yml",
-    )
+    ensure_cache_dir(cache_dir)
+    return _module_paths_cached(str(cache_dir), normalize_module_id(module_id))
 
 
-def list_modules(cache_dir: Path, github_token: str | None) -> list[ModuleId]:
-    """List top-level modules, using a local cache when available."""
-    cached = read_cached_modules_list(cache_dir)
-    if cached:
-        return cached
+def list_modules(
+    cache_dir: Path, github_token: str | None, *, refresh: bool = False
+) -> list[ModuleId]:
+    """List top-level modules, using a local cache when available.
 
-    entries = fetch_directory_entries(API_BASE, github_token)
-    modules = _extract_directories(entries)
+    Results are memoized in-process per cache directory. With ``refresh=True``
+    the listing is revalidated against GitHub using the stored ETag, so an
+    unchanged catalog costs no rate-limited request. The on-disk list is
+    revalidated the same way once it is older than an hour; if GitHub cannot
+    be reached then, the stale list is returned and memoized like a fresh one.
+    """
+    key = (os.path.abspath(cache_dir), _token_key(github_token))
+    cached: list[ModuleId] = []
+    if not refresh:
+        memoized = _modules_memo.get(key)
+        if memoized is not None:
+            return list(memoized)
+        cached = read_cached_modules_list(cache_dir)
+        if cached and _catalog_age(cache_dir) < CATALOG_MAX_AGE_SECONDS:
+            _modules_memo.put(key, tuple(cached))
+            return cached
+
+    try:
+        modules = _fetch_top_level_modules(cache_dir, github_token)
+    except ValueError:
+        if not cached:
+            raise
+        # Offline: keep serving the stale list from memory instead of retrying
+        # GitHub on every call until the memo expires.
+        _modules_memo.put(key, tuple(cached))
+        return cached
     write_cached_modules_list(cache_dir, modules)
+    _modules_memo.put(key, tuple(modules))
     return modules
 
 
 def list_submodules(module_id: str, github_token: str | None) -> list[ModuleId]:
-    """List submodules under a given module id."""
+    """List submodules under a given module id (memoized in-process).
+
+    Once the catalog tree has been fetched (``list_modules(refresh=True)`` or
+    :func:`list_all_submodules`), answers come from memory without a request.
+    """
     module_id = normalize_module_id(module_id)
-    entries = fetch_directory_entries(f"{API_BASE}/{module_id}", github_token)
-    return _extract_directories(entries)
+    key = (module_id, _token_key(github_token))
+    memoized = _submodules_memo.get(key)
+    if memoized is None:
+        entries = fetch_directory_entries(f"{API_BASE}/{module_id}", github_token)
+        memoized = tuple(_extract_directories(entries))
+        _submodules_memo.put(key, memoized)
+    return list(memoized)
+
+
+def list_all_submodules(
+    cache_dir: Path, github_token: str | None
+) -> dict[ModuleId, list[ModuleId]]:
+    """Map every top-level module to its submodules.
+
+    The whole catalog comes from a single recursive Git Trees request,
+    revalidated with the stored ETag. Only when GitHub truncates the tree does
+    this fall back to one contents listing per module.
+
+    Example:
+        >>> list_all_submodules(Path("nf-core-modules"), None)["samtools"][:2]
+        ['ampliconclip', 'bam2fq']
+    """
+    tree = _fetch_module_tree(cache_dir, github_token)
+    if tree is None:
+        return {
+            module: list_submodules(module, github_token)
+            for module in list_modules(cache_dir, github_token)
+        }
+    return {module: list(submodules) for module, submodules in tree.items()}
 
 
 def get_rate_limit_status(github_token: str | None) -> dict:
-    """Return GitHub API rate limit status."""
-    return fetch_rate_limit(github_token)
+    """Return GitHub API rate limit status, reusing answers younger than 30 seconds."""
+    key = _token_key(github_token)
+    status = _rate_limit_memo.get(key)
+    if status is None:
+        status = fetch_rate_limit(github_token)
+        _rate_limit_memo.put(key, status)
+    return dict(status)
+
+
+def clear_catalog_cache() -> None:
+    """Forget in-process memoized module listings and rate limit answers."""
+    _modules_memo.clear()
+    _submodules_memo.clear()
+    _rate_limit_memo.clear()
 
 
 def ensure_module(
@@ -140,30 +230,54 @@ def ensure_module(
         ``ModulePaths`` describing cached module files.
     """
     paths = module_paths(cache_dir, module_id)
-    paths.module_dir.mkdir(parents=True, exist_ok=True)
+    if force or not _is_cached(paths):
+        _download_modules([paths], github_token, force=force)
+    return paths
 
-    if _is_cached(paths) and not force:
-        return paths
 
-    urls = _raw_file_urls(paths.module_id)
-    _write_module_file(paths.main_nf, fetch_raw_text(urls["main_nf"], github_token))
-    _write_module_file(paths.meta_yml, fetch_raw_text(urls["meta_yml"], github_token))
-    return paths
+def ensure_modules(
+    cache_dir: Path,
+    module_ids: Sequence[ModuleId],
+    github_token: str | None,
+    *,
+    force: bool = False,
+) -> list[ModulePaths]:
+    """Ensure several nf-core modules are cached locally, downloading concurrently.
+
+    Every missing file of every module goes through the shared download pool,
+    which is what cache-warming needs.
+
+    Args:
+        cache_dir: Directory for cached module artifacts.
+        module_ids: Module identifiers to cache.
+        github_token: Optional GitHub token for authenticated requests.
+        force: When ``True``, re-download even if cached.
+
+    Returns:
+        ``ModulePaths`` for each module, in the order of ``module_ids``.
+    """
+    ensure_cache_dir(cache_dir)
+    all_paths = [
+        _module_paths_cached(str(cache_dir), normalize_module_id(module_id))
+        for module_id in module_ids
+    ]
+    missing = all_paths if force else _uncached(cache_dir, all_paths)
+    _download_modules(missing, github_token, force=force)
+    return all_paths
 
 
 def inspect_module(cache_dir: Path, module_id: ModuleId, github_token: str | None) -> dict:
     """Inspect module metadata and return a structured summary."""
     paths = ensure_module(cache_dir, module_id, github_token)
     meta = _read_yaml(paths.meta_yml)
-    main_preview = _preview_lines(paths.main_nf)
-    main_lines = paths.main_nf.read_text().splitlines()
+    main_preview, main_line_count = _preview_lines(paths.main_nf)
 
     return {
         "name": normalize_module_id(module_id),
         "path": str(paths.module_dir),
         "meta": meta,
         "meta_raw": paths.meta_yml.read_text(),
-        "main_nf_lines": len(main_lines),
+        "main_nf_lines": main_line_count,
         "main_nf_preview": main_preview,
     }
 
@@ -171,32 +285,26 @@ def inspect_module(cache_dir: Path, module_id: ModuleId, github_token: str | Non
 def get_module_inputs(cache_dir: Path, module_id: ModuleId, github_token: str | None) -> list[dict]:
     """Return module input definitions via Nextflow introspection."""
     paths = ensure_module(cache_dir, module_id, github_token)
+    jvm = _jvm_context()
+    script_path = str(paths.main_nf)
+
+    with managed_session(jvm["Session"], script_path) as session:
+        loader = jvm["ScriptLoaderFactory"].create(session)
+        loader.parse(jvm["Paths"].get(script_path))
+        script = loader.getScript()
+        return get_process_inputs(loader, script, jvm["ScriptMeta"])
+
 
+@lru_cache(maxsize=1)
+def _jvm_context() -> dict[str, Any]:
+    # JVM startup and class lookups happen once per process, not per module.
     jar_path = resolve_nextflow_jar_path(None)
     assert_nextflow_jar_exists(jar_path)
     start_jvm_if_needed(jar_path)
-
-    classes = load_nextflow_classes()
-    ScriptLoaderFactory = classes["ScriptLoaderFactory"]
-    Session = classes["Session"]
-    ScriptMeta = classes["ScriptMeta"]
-
-    ScriptFile = jpype.JClass("nextflow.script.ScriptFile")
-    ArrayList = jpype.JClass("java.util.ArrayList")
-
-    session = Session()
-    script_file = ScriptFile(jpype.java.nio.file.Paths.get(str(paths.main_nf)))
-    session.init(script_file, ArrayList(), None, None)
-    session.start()
-
-    loader = ScriptLoaderFactory.create(session)
-    java_path = jpype.java.nio.file.Paths.get(str(paths.main_nf))
-    loader.parse(java_path)
-    script = loader.getScript()
-
-    inputs = get_process_inputs(loader, script, ScriptMeta)
-    session.destroy()
-    return inputs
+    return {
+        **load_nextflow_classes(),
+        "Paths": java_class("java.nio.file.Paths"),
+    }
 
 
 def run_nfcore_module(
@@ -220,30 +328,246 @@ def run_nfcore_module(
     return execute_nextflow(module_request)
 
 
+def _token_key(github_token: str | None) -> str | None:
+    # Memo keys carry a digest, never the token itself.
+    if not github_token:
+        return None
+    return hashlib.blake2s(github_token.encode(), digest_size=8).hexdigest()
+
+
+def _catalog_age(cache_dir: Path) -> float:
+    # modules_list.txt is rewritten after every fetch or 304 revalidation, so
+    # its mtime records when the catalog was last confirmed current.
+    try:
+        return time.time() - os.stat(modules_list_path(cache_dir)).st_mtime
+    except FileNotFoundError:
+        return float("inf")
+
+
+@lru_cache(maxsize=64)
+def _modules_list_path_cached(cache_dir: str) -> Path:
+    return Path(f"{cache_dir}/{MODULES_LIST_FILENAME}")
+
+
+@lru_cache(maxsize=4096)
+def _module_paths_cached(cache_dir: str, module_id: ModuleId) -> ModulePaths:
+    # Plain string joins instead of repeated ``Path.__truediv__``.
+    base = f"{cache_dir}/{module_id}"
+    return ModulePaths(
+        module_id=module_id,
+        module_dir=Path(base),
+        main_nf=Path(f"{base}/main.nf"),
+        meta_yml=Path(f"{base}/meta.yml"),
+    )
+
+
 def _extract_directories(entries: list[dict]) -> list[ModuleId]:
     directories = [item["name"] for item in entries if item.get("type") == "dir"]
     return sorted(directories)
 
 
-def _raw_file_urls(module_id: ModuleId) -> dict[str, str]:
-    module_id = normalize_module_id(module_id)
-    return {
-        "main_nf": f"{RAW_BASE}/{module_id}/main.nf",
-        "meta_yml": f"{RAW_BASE}/{module_id}/meta.yml",
-    }
+def _fetch_top_level_modules(cache_dir: Path, github_token: str | None) -> list[ModuleId]:
+    # One recursive tree request covers the whole catalog; the contents API is
+    # only used when GitHub truncates the tree.
+    tree = _fetch_module_tree(cache_dir, github_token)
+    if tree is None:
+        return _fetch_directories_with_etag(cache_dir, API_BASE, github_token)
+    return list(tree)
 
 
-def _is_cached(paths: ModulePaths) -> bool:
-    return paths.main_nf.exists() and paths.meta_yml.exists()
+def _fetch_module_tree(
+    cache_dir: Path, github_token: str | None
+) -> dict[ModuleId, list[ModuleId]] | None:
+    # Returns None when the tree is truncated and the caller must fall back.
+    etags = _read_etags(cache_dir)
+    key = f"tree:{MODULES_REPO}@{MODULES_REF}"
+    cached = etags.get(key, {})
+    known_etag = cached.get("etag") if "modules" in cached else None
 
+    tree, etag = fetch_repo_tree_if_modified(
+        MODULES_REPO, MODULES_REF, github_token, known_etag
+    )
+    if tree is None:
+        modules = cached["modules"]
+    elif tree.get("truncated"):
+        return None
+    else:
+        modules = _extract_tree_modules(tree.get("tree", []))
+        if etag:
+            etags[key] = {"etag": etag, "sha": tree.get("sha"), "modules": modules}
+            _write_etags(cache_dir, etags)
+
+    # The tree already names every submodule, so later list_submodules calls
+    # are answered from memory instead of one contents request per module.
+    token_key = _token_key(github_token)
+    for module, submodules in modules.items():
+        _submodules_memo.put((module, token_key), tuple(submodules))
+    return modules
 
-def _write_module_file(dest: Path, content: str) -> None:
-    dest.write_text(content)
 
+def _fetch_directories_with_etag(
+    cache_dir: Path, api_url: str, github_token: str | None
+) -> list[ModuleId]:
+    etags = _read_etags(cache_dir)
+    cached = etags.get(api_url, {})
 
-def _read_yaml(path: Path) -> dict:
-    return yaml.safe_load(path.read_text())
+    entries, etag = fetch_directory_entries_if_modified(
+        api_url, github_token, cached.get("etag")
+    )
+    if entries is None:
+        return cached["directories"]
+
+    directories = _extract_directories(entries)
+    if etag:
+        etags[api_url] = {"etag": etag, "directories": directories}
+        _write_etags(cache_dir, etags)
+    return directories
+
+
+def _read_etags(cache_dir: Path) -> dict[str, dict]:
+    path = ensure_cache_dir(cache_dir) / ETAGS_FILENAME
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _write_etags(cache_dir: Path, etags: dict[str, dict]) -> None:
+    atomic_write_text(ensure_cache_dir(cache_dir) / ETAGS_FILENAME, json.dumps(etags))
+
+
+def _extract_tree_modules(entries: list[dict]) -> dict[ModuleId, list[ModuleId]]:
+    # Top-level modules are the direct subdirectories of the prefix and their
+    # submodules are the directories one level down: the same answer the
+    # contents API gives list_submodules, so the memo it seeds agrees with it.
+    modules: dict[str, list[str]] = {}
+    for item in entries:
+        path = item["path"]
+        if item["type"] != "tree" or not path.startswith(MODULES_TREE_PREFIX):
+            continue
+        parts = path[len(MODULES_TREE_PREFIX) :].split("/")
+        if len(parts) == 1:
+            modules.setdefault(parts[0], [])
+        elif len(parts) == 2:
+            modules.setdefault(parts[0], []).append(parts[1])
+    return {name: sorted(subs) for name, subs in sorted(modules.items())}
+
+
+@lru_cache(maxsize=4096)
+def _raw_file_urls(module_id: ModuleId) -> tuple[str, str]:
+    base = _RAW_PREFIX + normalize_module_id(module_id)
+    return base + "/main.nf", base + "/meta.yml"
+
+
+@lru_cache(maxsize=1)
+def _download_pool() -> ThreadPoolExecutor:
+    # Shared across ensure_module(s) calls so each download does not spin up
+    # threads; sized to the HTTP session's connection pool.
+    return ThreadPoolExecutor(max_workers=16, thread_name_prefix="pynf-download")
+
+
+def _download_modules(
+    missing: Sequence[ModulePaths], github_token: str | None, *, force: bool
+) -> None:
+    # Shared by ensure_module and ensure_modules. A forced download also drops
+    # the memoized catalog answers.
+    if force:
+        clear_catalog_cache()
+    pool = _download_pool()
+    downloads: list[Future] = []
+    for paths in missing:
+        paths.module_dir.mkdir(parents=True, exist_ok=True)
+        downloads.extend(_submit_module_downloads(pool, paths, github_token))
+    _wait_all(downloads)
+
+
+def _submit_module_downloads(
+    pool: ThreadPoolExecutor, paths: ModulePaths, github_token: str | None
+) -> list[Future]:
+    main_nf_url, meta_yml_url = _raw_file_urls(paths.module_id)
+    return [
+        pool.submit(download_raw_file, main_nf_url, paths.main_nf, github_token),
+        pool.submit(download_raw_file, meta_yml_url, paths.meta_yml, github_token),
+    ]
+
+
+def _wait_all(futures: Sequence[Future]) -> None:
+    for future in futures:
+        future.result()
+
+
+def _uncached(cache_dir: Path, all_paths: Sequence[ModulePaths]) -> list[ModulePaths]:
+    # One listing of the cache directory rules out modules whose top-level
+    # directory is absent; only the rest get the per-file check.
+    with os.scandir(cache_dir) as entries:
+        present = {entry.name for entry in entries if entry.is_dir()}
+    return [
+        paths
+        for paths in all_paths
+        if paths.module_id.split("/", 1)[0] not in present or not _is_cached(paths)
+    ]
 
 
-def _preview_lines(path: Path, limit: int = 20) -> list[str]:
-    return path.read_text().splitlines()[:limit]
+def _is_cached(paths: ModulePaths) -> bool:
+    # At most two stat calls, stopping at the first missing file. The memoized
+    # ModulePaths cache their string form, so no Path work happens here; and
+    # unlike listing the directory, cost does not grow with sibling submodules.
+    return os.path.isfile(paths.main_nf) and os.path.isfile(paths.meta_yml)
+
+
+def _read_yaml(path: Path) -> dict:
+    # Parsed documents are cached per (path, mtime); callers get their own copy.
+    return copy.deepcopy(_load_yaml_cached(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=512)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict:
+    # PyYAML is imported on first use: only module inspection parses YAML, so
+    # listing and running modules never load it.
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _preview_lines(path: Path, limit: int = 20) -> tuple[list[str], int]:
+    # One read serves both the preview and the total line count.
+    lines = path.read_text().splitlines()
+    return lines[:limit], len(lines)
+
+
+class _TTLCache:
+    """Small thread-safe LRU mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# In-process memos for catalog calls; see ``clear_catalog_cache``.
+_modules_memo = _TTLCache(CATALOG_TTL_SECONDS)
+_submodules_memo = _TTLCache(CATALOG_TTL_SECONDS, maxsize=4096)
+_rate_limit_memo = _TTLCache(RATE_LIMIT_TTL_SECONDS)
@@ -10,12 +10,20 @@ The goal is to keep the public runtime surface small and easy to reason about.
 
 from __future__ import annotations
 
+import os
+from collections import deque
 from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any, cast
 
 import jpype
 
+# Deepest nesting the walkers follow. The recursive versions stopped at the
+# interpreter's recursion limit, so cyclic values still fail fast.
+_MAX_DEPTH = 1000
+
 
 def to_python(value: Any) -> Any:
     """Convert a Java/JPype object into JSON-ish Python values.
@@ -28,35 +36,130 @@ def to_python(value: Any) -> Any:
     Returns:
         A Python-serializable value (or string fallback).
     """
-    if value is None or isinstance(value, (str, int, float, bool)):
+    # Scalars (the bulk of real outputs) skip the work stack entirely.
+    if _CONVERSIONS.get(type(value)) == _TO_SELF:
         return value
 
-    if isinstance(value, Path):
-        return str(value)
-
+    # Iterative: each container is created on the way down and its slots are
+    # filled in place, so deep Java structures need no recursion.
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any, int]] = [(root, 0, value, 0)]
+    while stack:
+        parent, slot, item, depth = stack.pop()
+        if depth > _MAX_DEPTH:
+            raise RecursionError("to_python: value is nested too deeply (cyclic?)")
+        converted, children = _convert_shallow(item)
+        parent[slot] = converted
+        for child_slot, child in reversed(children):
+            if _CONVERSIONS.get(type(child)) == _TO_SELF:
+                converted[child_slot] = child
+            else:
+                stack.append((converted, child_slot, child, depth + 1))
+    return root[0]
+
+
+def _convert_shallow(value: Any) -> tuple[Any, list[tuple[Any, Any]]]:
+    # Returns the converted node plus its (slot, raw child) pairs to fill in.
+    how = _CONVERSIONS.get(type(value))
+    if how is None:
+        how = _classify_conversion(value)
+
+    if how == _TO_SELF:
+        return value, []
+    if how == _TO_DICT_BULK:
+        # Entries, not keySet()/values() zipped: Map does not promise the two
+        # views iterate in the same order.
+        entries = value.entrySet().toArray()
+        return _dict_node((entry.getKey(), entry.getValue()) for entry in entries)
+    if how == _TO_LIST_BULK:
+        return _list_node(value.toArray())
+    if how == _TO_NUMBERS:
+        return memoryview(value).tolist(), []
+    if how == _TO_DICT:
+        entries = _iter_java(value.entrySet().iterator())
+        return _dict_node((entry.getKey(), entry.getValue()) for entry in entries)
+    if how == _TO_LIST_JAVA:
+        return _list_node(_iter_java(value.iterator()))
+    if how == _TO_LIST:
+        return _list_node(cast(Iterable[Any], value))
+    return str(value), []
+
+
+# How to_python converts each concrete type, worked out once per type like
+# flatten_paths' _KINDS table.
+(
+    _TO_SELF,
+    _TO_STR,
+    _TO_DICT_BULK,
+    _TO_LIST_BULK,
+    _TO_DICT,
+    _TO_LIST_JAVA,
+    _TO_LIST,
+    _TO_NUMBERS,
+) = range(8)
+
+_CONVERSIONS: dict[type, int] = {
+    type(None): _TO_SELF,
+    str: _TO_SELF,
+    int: _TO_SELF,
+    float: _TO_SELF,
+    bool: _TO_SELF,
+}
+
+
+def _classify_conversion(value: Any) -> int:
+    collection_classes = _java_collection_classes()
+    # Subclasses count too (e.g. JPype boxed primitives).
+    if isinstance(value, (str, int, float, bool)):
+        how = _TO_SELF
+    # Java paths are Iterable<Path> over their own segments (a one-segment
+    # path yields itself), so they must become strings before the iterator
+    # fallback below.
+    elif (
+        isinstance(value, Path)
+        or _is_java_path_like(value)
+        or callable(getattr(value, "toAbsolutePath", None))
+    ):
+        how = _TO_STR
+    # Numeric primitive arrays expose the buffer protocol, so the whole array
+    # becomes a list of plain Python numbers in one C-level copy.
+    elif _is_numeric_java_array(value):
+        how = _TO_NUMBERS
+    # Real Java collections: copy out with one toArray() call each instead of
+    # a hasNext()/next() round trip through JPype per element.
+    elif collection_classes and isinstance(value, collection_classes[1]):
+        how = _TO_DICT_BULK
+    elif collection_classes and isinstance(value, collection_classes[0]):
+        how = _TO_LIST_BULK
     # Java Map-like
-    if hasattr(value, "entrySet") and callable(value.entrySet):
-        out: dict[Any, Any] = {}
-        entry_set = value.entrySet()
-        iterator = entry_set.iterator()
-        while iterator.hasNext():  # type: ignore[attr-defined]
-            entry = iterator.next()  # type: ignore[attr-defined]
-            out[to_python(entry.getKey())] = to_python(entry.getValue())
-        return out
-
+    elif callable(getattr(value, "entrySet", None)):
+        how = _TO_DICT
     # Java Iterable / Iterator
-    iterator_factory = getattr(value, "iterator", None)
-    if callable(iterator_factory):
-        iterator = iterator_factory()
-        out_list: list[Any] = []
-        while iterator.hasNext():  # type: ignore[attr-defined]
-            out_list.append(to_python(iterator.next()))  # type: ignore[attr-defined]
-        return out_list
+    elif callable(getattr(value, "iterator", None)):
+        how = _TO_LIST_JAVA
+    elif isinstance(value, Iterable):
+        how = _TO_LIST
+    else:
+        how = _TO_STR
+    _CONVERSIONS[type(value)] = how
+    return how
+
 
-    if isinstance(value, Iterable):
-        return [to_python(v) for v in cast(Iterable[Any], value)]
+def _dict_node(pairs: Iterable[tuple[Any, Any]]) -> tuple[dict, list[tuple[Any, Any]]]:
+    # Keys are small scalars in practice, so they are converted straight away;
+    # reserving each key now keeps the original insertion order.
+    out: dict[Any, Any] = {}
+    children: list[tuple[Any, Any]] = []
+    for key, child in pairs:
+        key = to_python(key)
+        out[key] = None
+        children.append((key, child))
+    return out, children
 
-    return str(value)
+
+def _list_node(items: Iterable[Any]) -> tuple[list, list[tuple[Any, Any]]]:
+    children = list(enumerate(items))
+    return [None] * len(children), children
 
 
 class NextflowResult:
@@ -69,39 +172,54 @@ class NextflowResult:
     def __init__(
         self,
         *,
-        workflow_events: list[dict] | None = None,
-        file_events: list[dict] | None = None,
-        task_workdirs: list[str] | None = None,
+        workflow_events: Sequence[dict] | None = None,
+        file_events: Sequence[dict] | None = None,
+        task_workdirs: Sequence[str] | None = None,
         work_dir: str | None = None,
         execution_report: dict[str, Any] | None = None,
     ) -> None:
-        self._workflow_events = workflow_events or []
-        self._file_events = file_events or []
-        self._task_workdirs = task_workdirs or []
+        # Stored as tuples so the accessors can hand them out without copying.
+        # Non-dict events are dropped once here, so get_workflow_outputs needs
+        # no per-event type check.
+        self._workflow_events = tuple(
+            event for event in workflow_events or () if isinstance(event, dict)
+        )
+        self._file_events = tuple(
+            event for event in file_events or () if isinstance(event, dict)
+        )
+        self._task_workdirs = tuple(task_workdirs or ())
         self._work_dir = work_dir
         self._execution_report = execution_report or {}
+        # Walking the Java event trees is the expensive part, so each accessor
+        # does it once and later calls hand out copies.
+        self._output_files: list[str] | None = None
+        self._workflow_outputs: list[dict[str, Any]] | None = None
 
     def get_output_files(self) -> list[str]:
         """Return output file paths, preferring published metadata."""
-        paths = collect_paths_from_events(self._workflow_events, self._file_events)
-        if not paths:
-            paths = collect_paths_from_workdirs(self._task_workdirs)
-        return paths
+        if self._output_files is None:
+            paths: list[str] = []
+            if self._workflow_events or self._file_events:
+                paths = collect_paths_from_events(
+                    self._workflow_events, self._file_events
+                )
+            if not paths and self._task_workdirs:
+                paths = collect_paths_from_workdirs(self._task_workdirs)
+            self._output_files = paths
+        return list(self._output_files)
 
     def get_workflow_outputs(self) -> list[dict[str, Any]]:
         """Return workflow outputs as JSON-ish Python structures."""
-        outputs: list[dict[str, Any]] = []
-        for event in self._workflow_events:
-            if not isinstance(event, dict):
-                continue
-            outputs.append(
+        if self._workflow_outputs is None:
+            self._workflow_outputs = [
                 {
                     "name": event.get("name"),
                     "value": to_python(event.get("value")),
                     "index": to_python(event.get("index")),
                 }
-            )
-        return outputs
+                for event in self._workflow_events
+            ]
+        return [dict(output) for output in self._workflow_outputs]
 
     def get_execution_report(self) -> dict[str, Any]:
         """Return execution statistics snapshotted during the run."""
@@ -110,149 +228,229 @@ class NextflowResult:
     def get_stdout(self) -> str:
         """Return the first available ``.command.out`` from captured workdirs."""
         for workdir in self._task_workdirs:
+            # One read instead of exists() + read_text(); missing files just
+            # move on to the next workdir.
             try:
-                out_path = Path(workdir) / ".command.out"
-                if out_path.exists():
-                    return out_path.read_text()
+                return Path(workdir, ".command.out").read_text(errors="replace")
             except Exception:
                 continue
         return ""
 
-    def workflow_events(self) -> list[dict]:
-        return list(self._workflow_events)
+    def workflow_events(self) -> tuple[dict, ...]:
+        return self._workflow_events
 
-    def file_events(self) -> list[dict]:
-        return list(self._file_events)
+    def file_events(self) -> tuple[dict, ...]:
+        return self._file_events
 
-    def task_workdirs(self) -> list[str]:
-        return list(self._task_workdirs)
+    def task_workdirs(self) -> tuple[str, ...]:
+        return self._task_workdirs
 
 
 def flatten_paths(value: Any) -> Iterator[str]:
     """Yield normalized filesystem paths from nested Java/Python structures."""
+    if type(value) is str:
+        # Bare path strings are the common payload; skip the walk entirely.
+        if value:
+            yield value
+        return
+
+    # Explicit stack of iterators (depth-first, same order as a recursive walk)
+    # instead of one generator frame per nesting level.
+    stack: deque[Iterator[Any]] = deque([iter((value,))])
+    while stack:
+        if len(stack) > _MAX_DEPTH:
+            raise RecursionError("flatten_paths: value is nested too deeply (cyclic?)")
+        try:
+            obj = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            continue
 
-    def visit(obj: Any) -> Iterator[str]:
         if obj is None:
-            return
+            continue
+
+        kind = _KINDS.get(type(obj))
+        if kind is None:
+            kind = _classify(obj)
 
-        if isinstance(obj, str):
+        if kind == _STR:
             if obj:
                 yield obj
-            return
-
-        if _is_java_path_like(obj):
-            if hasattr(obj, "toAbsolutePath"):
-                yield str(obj.toAbsolutePath())
-            elif hasattr(obj, "toPath"):
-                yield str(obj.toPath())
-            else:
-                yield str(obj)
-            return
-
-        if isinstance(obj, Path):
+        elif kind == _PATH:
             yield str(obj)
-            return
-
-        if isinstance(obj, dict):
-            for item in obj.values():
-                yield from visit(item)
-            return
-
-        if isinstance(obj, (list, tuple, set)):
-            for item in obj:
-                yield from visit(item)
-            return
-
-        if jpype.isJArray(obj):  # type: ignore[attr-defined]
-            for item in cast(Iterable[Any], obj):
-                yield from visit(item)
-            return
-
-        if hasattr(obj, "entrySet") and callable(obj.entrySet):
-            entry_set = obj.entrySet()
-            iterator_factory = getattr(entry_set, "iterator", None)
+        elif kind == _DICT:
+            stack.append(iter(obj.values()))
+        elif kind == _ITERABLE:
+            stack.append(iter(obj))
+        elif kind == _JAVA_PATH:
+            to_path = getattr(obj, "toAbsolutePath", None) or getattr(
+                obj, "toPath", None
+            )
+            yield str(to_path() if to_path is not None else obj)
+        elif kind == _JAVA_COLLECTION:
+            stack.append(iter(obj.toArray()))
+        elif kind == _JAVA_MAP_VALUES:
+            stack.append(iter(obj.values().toArray()))
+        elif kind == _JAVA_MAP:
+            iterator_factory = getattr(obj.entrySet(), "iterator", None)
             if callable(iterator_factory):
-                iterator = cast(Any, iterator_factory())
-                while iterator.hasNext():  # type: ignore[attr-defined]
-                    entry = iterator.next()  # type: ignore[attr-defined]
-                    yield from visit(entry.getValue())
-            return
-
-        iterator_factory = getattr(obj, "iterator", None)
-        if callable(iterator_factory):
-            iterator = cast(Any, iterator_factory())
-            while iterator.hasNext():  # type: ignore[attr-defined]
-                yield from visit(iterator.next())  # type: ignore[attr-defined]
-            return
-
-        if isinstance(obj, Iterable):
-            for item in cast(Iterable[Any], obj):
-                yield from visit(item)
-            return
-
-        if hasattr(obj, "getValue") and callable(obj.getValue):
-            yield from visit(obj.getValue())
-
-    yield from visit(value)
+                entries = _iter_java(iterator_factory())
+                stack.append(entry.getValue() for entry in entries)
+        elif kind == _JAVA_ITERABLE:
+            stack.append(_iter_java(obj.iterator()))
+        elif kind == _VALUE_HOLDER:
+            stack.append(iter((obj.getValue(),)))
+
+
+# How flatten_paths treats each concrete type. Classification depends only on
+# the type (JPype proxy classes are shared by all their instances), so it is
+# worked out once per type and then answered with a single dict probe.
+(
+    _SKIP,
+    _STR,
+    _PATH,
+    _DICT,
+    _ITERABLE,
+    _JAVA_PATH,
+    _JAVA_COLLECTION,
+    _JAVA_MAP_VALUES,
+    _JAVA_MAP,
+    _JAVA_ITERABLE,
+    _VALUE_HOLDER,
+) = range(11)
+
+_KINDS: dict[type, int] = {
+    str: _STR,
+    dict: _DICT,
+    list: _ITERABLE,
+    tuple: _ITERABLE,
+    set: _ITERABLE,
+}
+
+
+def _classify(obj: Any) -> int:
+    collection_classes = _java_collection_classes()
+    if isinstance(obj, str):
+        kind = _STR
+    elif isinstance(obj, Path):
+        kind = _PATH
+    elif isinstance(obj, dict):
+        kind = _DICT
+    elif isinstance(obj, (list, tuple, set)):
+        kind = _ITERABLE
+    elif _is_java_path_like(obj):
+        kind = _JAVA_PATH
+    elif _is_numeric_java_array(obj):
+        # Numbers never hold paths; skip without touching the elements.
+        kind = _SKIP
+    elif _is_java_array_type(type(obj)):
+        kind = _ITERABLE
+    elif collection_classes and isinstance(obj, collection_classes[0]):
+        kind = _JAVA_COLLECTION
+    elif collection_classes and isinstance(obj, collection_classes[1]):
+        kind = _JAVA_MAP_VALUES
+    elif callable(getattr(obj, "entrySet", None)):
+        kind = _JAVA_MAP
+    elif callable(getattr(obj, "iterator", None)):
+        kind = _JAVA_ITERABLE
+    elif isinstance(obj, Iterable):
+        kind = _ITERABLE
+    elif callable(getattr(obj, "getValue", None)):
+        kind = _VALUE_HOLDER
+    else:
+        kind = _SKIP
+    _KINDS[type(obj)] = kind
+    return kind
+
+
+def _iter_java(iterator: Any) -> Iterator[Any]:
+    while iterator.hasNext():  # type: ignore[attr-defined]
+        yield iterator.next()  # type: ignore[attr-defined]
 
 
 def collect_paths_from_events(
     workflow_events: Sequence[dict], file_events: Sequence[dict]
 ) -> list[str]:
     """Collect unique paths from workflow and file publish events."""
-    seen: set[str] = set()
-    result: list[str] = []
-
-    for event in workflow_events:
-        if not isinstance(event, dict):
-            continue
-        extend_unique(result, seen, flatten_paths(event.get("value")))
-        extend_unique(result, seen, flatten_paths(event.get("index")))
-
-    for event in file_events:
-        if not isinstance(event, dict):
-            continue
-        extend_unique(result, seen, flatten_paths(event.get("target")))
-
-    return result
+    roots = [
+        value
+        for event in workflow_events
+        if isinstance(event, dict)
+        for value in (event.get("value"), event.get("index"))
+    ]
+    roots.extend(
+        event.get("target") for event in file_events if isinstance(event, dict)
+    )
+    # One walk over every root; an insertion-ordered dict dedupes in C.
+    return list(dict.fromkeys(flatten_paths(roots)))
 
 
 def collect_paths_from_workdirs(task_workdirs: Sequence[str]) -> list[str]:
     """Collect visible files from task work directories."""
-    outputs: list[str] = []
-    seen: set[str] = set()
-    for workdir in task_workdirs:
-        extend_unique(outputs, seen, _iter_visible_files(workdir))
-    return outputs
-
-
-def extend_unique(result_list: list[str], seen: set[str], values: Iterable[str]) -> None:
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        result_list.append(value)
+    files = chain.from_iterable(map(_iter_visible_files, task_workdirs))
+    return list(dict.fromkeys(files))
 
 
 def _iter_visible_files(workdir: str) -> Iterator[str]:
-    workdir_path = Path(workdir)
-    if not workdir_path.exists():
+    abs_workdir = os.path.abspath(workdir)
+    try:
+        entries = os.scandir(abs_workdir)
+    except (FileNotFoundError, NotADirectoryError):
         return
-    for file in workdir_path.iterdir():
-        if file.is_file() and not file.name.startswith("."):
-            yield str(file.absolute())
+    with entries:
+        for entry in entries:
+            if not entry.name.startswith(".") and entry.is_file():
+                yield os.path.join(abs_workdir, entry.name)
 
 
 def _is_java_path_like(obj: Any) -> bool:
-    if not jpype.isJVMStarted():  # type: ignore[attr-defined]
-        return False
+    classes = _java_path_classes()
+    return bool(classes) and isinstance(obj, classes)
+
+
+_JAVA_PATH_CLASSES: tuple[type, ...] | None = None
+
+
+def _java_path_classes() -> tuple[type, ...]:
+    # Resolve the JClass handles once; stay empty (and retry) until the JVM is up.
+    global _JAVA_PATH_CLASSES
+    if _JAVA_PATH_CLASSES is None:
+        if not jpype.isJVMStarted():  # type: ignore[attr-defined]
+            return ()
+        _JAVA_PATH_CLASSES = (
+            jpype.JClass("java.nio.file.Path"),
+            jpype.JClass("java.io.File"),
+        )
+    return _JAVA_PATH_CLASSES
+
+
+_JAVA_COLLECTION_CLASSES: tuple[type, ...] | None = None
+
+
+def _java_collection_classes() -> tuple[type, ...]:
+    # (java.util.Collection, java.util.Map), resolved like _java_path_classes.
+    global _JAVA_COLLECTION_CLASSES
+    if _JAVA_COLLECTION_CLASSES is None:
+        if not jpype.isJVMStarted():  # type: ignore[attr-defined]
+            return ()
+        _JAVA_COLLECTION_CLASSES = (
+            jpype.JClass("java.util.Collection"),
+            jpype.JClass("java.util.Map"),
+        )
+    return _JAVA_COLLECTION_CLASSES
+
+
+@lru_cache(maxsize=256)
+def _is_java_array_type(cls: type) -> bool:
+    return issubclass(cls, jpype.JArray)
+
 
-    java_path = jpype.JClass("java.nio.file.Path")
-    if isinstance(obj, java_path):
-        return True
+# JVM descriptors of byte/short/int/long/float/double arrays.
+_NUMERIC_ARRAY_DESCRIPTORS = frozenset({"[B", "[S", "[I", "[J", "[F", "[D"})
 
-    java_file = jpype.JClass("java.io.File")
-    if isinstance(obj, java_file):
-        return True
 
-    return False
+def _is_numeric_java_array(obj: Any) -> bool:
+    return (
+        _is_java_array_type(type(obj))
+        and str(obj.getClass().getName()) in _NUMERIC_ARRAY_DESCRIPTORS
+    )
@@ -17,7 +17,7 @@ InputGroup = Mapping[ParamName, ParamValue]
 InputGroups = Sequence[InputGroup]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChannelParam:
     """Describe a single parameter within a Nextflow input channel.
 
@@ -35,7 +35,7 @@ class ChannelParam:
     name: ParamName
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChannelInfo:
     """Describe a Nextflow input channel and its constituent parameters.
 
@@ -54,7 +54,7 @@ class ChannelInfo:
     params: Sequence[ChannelParam]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModulePaths:
     """Resolve and store local paths for a cached nf-core module.
 
@@ -80,7 +80,7 @@ class ModulePaths:
     meta_yml: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DockerConfig:
     """Docker configuration values for Nextflow execution.
 
@@ -103,7 +103,7 @@ class DockerConfig:
     run_options: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionRequest:
     """Immutable request describing a Nextflow execution.
 
@@ -9,6 +9,9 @@ from __future__ import annotations
 from collections.abc import Mapping, Sequence
 from typing import Any
 
+# Rule framing every formatted validation error.
+_SEP = "=" * 70
+
 
 def validate_meta_map(
     meta: Mapping[str, Any], required_fields: Sequence[str] | None = None
@@ -75,10 +78,29 @@ def validate_inputs(inputs, input_channels) -> None:
     normalized_inputs = normalize_inputs(inputs)
     _validate_input_count(normalized_inputs, input_channels)
 
-    for idx, (user_input, expected_channel) in enumerate(
-        zip(normalized_inputs, input_channels)
+    # Parameter name sets are worked out once per channel.
+    channel_specs = [_channel_spec(channel) for channel in input_channels]
+    for idx, (user_input, channel_spec) in enumerate(
+        zip(normalized_inputs, channel_specs)
     ):
-        _validate_input_group(user_input, expected_channel, idx)
+        _validate_input_group(user_input, channel_spec, idx)
+
+
+def _channel_spec(channel) -> tuple[Any, set[str], list]:
+    """Precompute what validation needs from one channel definition.
+
+    Args:
+        channel: Channel metadata extracted from the script.
+
+    Returns:
+        ``(channel_type, param_names, params)`` for the channel.
+
+    Example:
+        >>> _channel_spec({'type': 'tuple', 'params': [{'name': 'reads', 'type': 'path'}]})
+        ('tuple', {'reads'}, [{'name': 'reads', 'type': 'path'}])
+    """
+    params = channel.get("params", [])
+    return channel.get("type"), {p["name"] for p in params}, params
 
 
 def _validate_input_count(inputs, input_channels) -> None:
@@ -98,25 +120,23 @@ def _validate_input_count(inputs, input_channels) -> None:
         raise ValueError(_format_count_error(inputs, input_channels))
 
 
-def _validate_input_group(user_input, expected_channel, group_idx: int) -> None:
+def _validate_input_group(user_input, channel_spec, group_idx: int) -> None:
     """Validate a single input group against a channel definition.
 
     Args:
         user_input: Mapping for the current input group.
-        expected_channel: Channel metadata extracted from the script.
+        channel_spec: Precomputed channel details from :func:`_channel_spec`.
         group_idx: Zero-based group index used for error messages.
 
     Raises:
         ValueError: If required parameters are missing or extra parameters exist.
 
     Example:
-        >>> _validate_input_group({'reads': 'a.fq'}, expected_channel, 0)
+        >>> _validate_input_group({'reads': 'a.fq'}, channel_spec, 0)
     """
-    channel_type = expected_channel.get("type")
-    expected_params = expected_channel.get("params", [])
-
-    expected_param_names = {p["name"] for p in expected_params}
-    user_param_names = set(user_input.keys())
+    channel_type, expected_param_names, expected_params = channel_spec
+    # Key views support set algebra directly; no copy of the user's keys.
+    user_param_names = user_input.keys()
 
     missing_params = expected_param_names - user_param_names
     if missing_params:
@@ -151,9 +171,9 @@ def _format_count_error(inputs, input_channels) -> str:
     count = len(inputs) if inputs else 0
     lines = [
         "",
-        "=" * 70,
+        _SEP,
         "ERROR: Incorrect number of input groups",
-        "=" * 70,
+        _SEP,
         "",
         f"Expected {len(input_channels)} input group(s), but got {count}",
         "",
@@ -166,7 +186,7 @@ def _format_count_error(inputs, input_channels) -> str:
             ["", "Provided inputs:", _format_provided_inputs(inputs).rstrip("\n")]
         )
 
-    lines.extend(["", "=" * 70, ""])
+    lines.extend(["", _SEP, ""])
     return "\n".join(lines)
 
 
@@ -190,16 +210,16 @@ def _format_missing_params_error(
     group_number = group_idx + 1
     lines = [
         "",
-        "=" * 70,
+        _SEP,
         f"ERROR: Missing required parameters in input group {group_number}",
-        "=" * 70,
+        _SEP,
         "",
         f"Missing parameters: {', '.join(sorted(missing_params))}",
         "",
         f"Input group {group_number} expects (type: {channel_type}):",
     ]
     lines.extend(f"  - {param['type']}({param['name']})" for param in expected_params)
-    lines.extend(["", "=" * 70, ""])
+    lines.extend(["", _SEP, ""])
     return "\n".join(lines)
 
 
@@ -223,16 +243,16 @@ def _format_extra_params_error(
     group_number = group_idx + 1
     lines = [
         "",
-        "=" * 70,
+        _SEP,
         f"ERROR: Unexpected parameters in input group {group_number}",
-        "=" * 70,
+        _SEP,
         "",
         f"Unexpected parameters: {', '.join(sorted(extra_params))}",
         "",
         f"Input group {group_number} expects (type: {channel_type}):",
     ]
     lines.extend(f"  - {param['type']}({param['name']})" for param in expected_params)
-    lines.extend(["", "=" * 70, ""])
+    lines.extend(["", _SEP, ""])
     return "\n".join(lines)
 
 
@@ -250,13 +270,10 @@ def _format_expected_structure(input_channels) -> str:
     """
     lines = ["inputs=["]
     for idx, channel in enumerate(input_channels):
-        channel_type = channel.get("type")
-        params = channel.get("params", [])
-        lines.append(f"    # Group {idx + 1} (type: {channel_type})")
-        param_strs = [f"'{p['name']}': <value>" for p in params]
+        param_strs = [f"'{p['name']}': <value>" for p in channel.get("params", [])]
+        lines.append(f"    # Group {idx + 1} (type: {channel.get('type')})")
         lines.append(f"    {{{', '.join(param_strs)}}},")
-    lines.append("]")
-    lines.append("")
+    lines.extend(["]", ""])
     return "\n".join(lines)
 
 
@@ -276,6 +293,5 @@ def _format_provided_inputs(inputs) -> str:
     for idx, inp in enumerate(inputs):
         lines.append(f"    # Group {idx + 1}")
         lines.append(f"    {inp},")
-    lines.append("]")
-    lines.append("")
+    lines.extend(["]", ""])
     return "\n".join(lines)
@@ -9,6 +9,7 @@ from ._core.execution import execute_nextflow
 from ._core.nfcore_modules import get_rate_limit_status as _get_rate_limit_status
 from ._core.nfcore_modules import list_modules as _list_modules
 from ._core.nfcore_modules import list_submodules as _list_submodules
+from ._core.nfcore_modules import list_all_submodules as _list_all_submodules
 from ._core.nfcore_modules import get_module_inputs as _get_module_inputs
 from ._core.nfcore_modules import inspect_module as _inspect_module
 from ._core.nfcore_modules import run_nfcore_module
@@ -71,13 +72,16 @@ def run_module(
 
 
 def list_modules(
-    cache_dir: Path = DEFAULT_CACHE_DIR, github_token: str | None = None
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    github_token: str | None = None,
+    refresh: bool = False,
 ) -> list[str]:
     """List available modules, using cache when possible.
 
     Args:
         cache_dir: Cache directory for module metadata.
         github_token: Optional GitHub token for authenticated requests.
+        refresh: When ``True``, revalidate the cached list against GitHub.
 
     Returns:
         Sorted list of module identifiers.
@@ -86,7 +90,7 @@ def list_modules(
         >>> list_modules(Path("/tmp/modules"))
         ['fastqc', 'samtools']
     """
-    return _list_modules(cache_dir, github_token)
+    return _list_modules(cache_dir, github_token, refresh=refresh)
 
 
 def list_submodules(module_id: ModuleId, github_token: str | None = None) -> list[str]:
@@ -106,6 +110,25 @@ def list_submodules(module_id: ModuleId, github_token: str | None = None) -> lis
     return _list_submodules(module_id, github_token)
 
 
+def list_all_submodules(
+    cache_dir: Path = DEFAULT_CACHE_DIR, github_token: str | None = None
+) -> dict[ModuleId, list[str]]:
+    """Map every module to its submodules using a single GitHub request.
+
+    Args:
+        cache_dir: Directory used to store the cached catalog ETag.
+        github_token: Optional GitHub token for authenticated requests.
+
+    Returns:
+        Mapping of module identifier to its sorted submodule names.
+
+    Example:
+        >>> list_all_submodules()["samtools"][:2]
+        ['ampliconclip', 'bam2fq']
+    """
+    return _list_all_submodules(cache_dir, github_token)
+
+
 def inspect_module(
     module_id: ModuleId,
     cache_dir: Path = DEFAULT_CACHE_DIR,
@@ -11,7 +11,7 @@ from rich.console import Console
 from rich.table import Table
 
 from . import api
-from ._core.nfcore_modules import ensure_module
+from ._core.nfcore_modules import ensure_modules
 from ._core.types import DockerConfig, ExecutionRequest
 
 # Create a rich console for pretty printing
@@ -224,20 +224,28 @@ def cli(ctx, cache_dir: Optional[str], github_token: Optional[str]):
     is_flag=True,
     help="Show GitHub API rate limit status.",
 )
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Revalidate the cached module list against GitHub.",
+)
 @pass_context
-def list_modules_cmd(ctx: CLIContext, limit: Optional[int], rate_limit: bool):
+def list_modules_cmd(
+    ctx: CLIContext, limit: Optional[int], rate_limit: bool, refresh: bool
+):
     """List available nf-core modules.
 
     Args:
         ctx: Click context containing CLI configuration.
         limit: Optional number of modules to display.
         rate_limit: When ``True``, display GitHub API rate limit info.
+        refresh: When ``True``, revalidate the cached module list.
     """
     try:
         with console.status("[bold green]Fetching modules..."):
             cache_dir = ctx.cache_dir or api.DEFAULT_CACHE_DIR
             modules = api.list_modules(
-                cache_dir=cache_dir, github_token=ctx.github_token
+                cache_dir=cache_dir, github_token=ctx.github_token, refresh=refresh
             )
 
         if not modules:
@@ -324,30 +332,34 @@ def list_submodules(ctx: CLIContext, module: str):
 
 
 @cli.command()
-@click.argument("module")
+@click.argument("modules", nargs=-1, required=True)
 @click.option(
     "--force",
     is_flag=True,
     help="Force re-download even if module is cached.",
 )
 @pass_context
-def download(ctx: CLIContext, module: str, force: bool):
-    """Download an nf-core module into the local cache.
+def download(ctx: CLIContext, modules: tuple[str, ...], force: bool):
+    """Download one or more nf-core modules into the local cache.
 
     Args:
         ctx: Click context containing CLI configuration.
-        module: Module identifier to download.
+        modules: Module identifiers to download; several are fetched concurrently.
         force: When ``True``, re-download even if cached.
     """
     try:
-        with console.status(f"[bold green]Downloading '{module}'..."):
+        with console.status(f"[bold green]Downloading {', '.join(modules)}..."):
             cache_dir = ctx.cache_dir or api.DEFAULT_CACHE_DIR
-            paths = ensure_module(cache_dir, module, ctx.github_token, force=force)
+            all_paths = ensure_modules(
+                cache_dir, modules, ctx.github_token, force=force
+            )
 
-        console.print(f"\n[green]✓ Module downloaded successfully![/green]")
-        console.print(f"  Location: [cyan]{paths.module_dir}[/cyan]")
-        console.print(f"  main.nf: [cyan]{paths.main_nf}[/cyan]")
-        console.print(f"  meta.yml: [cyan]{paths.meta_yml}[/cyan]")
+        noun = "Module" if len(all_paths) == 1 else f"{len(all_paths)} modules"
+        console.print(f"\n[green]✓ {noun} downloaded successfully![/green]")
+        for paths in all_paths:
+            console.print(f"  Location: [cyan]{paths.module_dir}[/cyan]")
+            console.print(f"  main.nf: [cyan]{paths.main_nf}[/cyan]")
+            console.print(f"  meta.yml: [cyan]{paths.meta_yml}[/cyan]")
 
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]", style="bold")
@@ -31,6 +31,10 @@ def start_jvm_if_needed(jar_path: Path) -> None:
     """Start the JVM with the Nextflow JAR on the classpath."""
     ...
 
+def java_class(name: str) -> Any:
+    """Resolve a Java class once per process (the JVM must already be running)."""
+    ...
+
 def load_nextflow_classes() -> dict[str, Any]:
     """Load the Nextflow Java classes required by the runtime."""
     ...
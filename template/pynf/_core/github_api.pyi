@@ -4,6 +4,17 @@ from __future__ import annotations
 
 from typing import Any
 
+def get_session() -> requests.Session:
+    """Return the shared HTTP session used for GitHub requests.
+
+Reusing one session keeps connections to ``api.github.com`` and
+``raw.githubusercontent.com`` alive across calls instead of paying a new
+TCP+TLS handshake per file.
+
+Returns:
+    A process-wide ``requests.Session`` with pooling and retries configured."""
+    ...
+
 def fetch_directory_entries(
     api_url: str, github_token: str | None
 ) -> list[dict[str, Any]]:
@@ -24,22 +35,94 @@ Example:
     [{'name': 'fastqc', 'type': 'dir'}]"""
     ...
 
-def fetch_raw_text(raw_url: str, github_token: str | None = None) -> str:
-    """Fetch a raw file's text content.
+def fetch_directory_entries_if_modified(
+    api_url: str,
+    github_token: str | None,
+    etag: str | None,
+) -> tuple[list[dict[str, Any]] | None, str | None]:
+    """Fetch directory entries unless they match a previously seen ETag.
+
+GitHub answers ``304 Not Modified`` to a matching ``If-None-Match`` header,
+and such responses do not count against the API rate limit.
 
 Args:
-    raw_url: Raw GitHub URL for the file.
+    api_url: GitHub API URL for the target directory.
+    github_token: Optional GitHub token for authenticated requests.
+    etag: ETag from a previous response, or ``None`` for an unconditional fetch.
+
+Returns:
+    ``(entries, etag)``. ``entries`` is ``None`` when the listing is unchanged.
+
+Raises:
+    ValueError: If the GitHub API request fails.
+
+Example:
+    >>> fetch_directory_entries_if_modified("https://api.github.com/...", None, 'W/"abc"')
+    (None, 'W/"abc"')"""
+    ...
+
+def fetch_repo_tree_if_modified(
+    repo: str,
+    ref: str,
+    github_token: str | None,
+    etag: str | None,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Fetch a repository's whole Git tree in a single request.
+
+Uses ``GET /repos/{repo}/git/trees/{ref}?recursive=1``. GitHub sets
+``truncated`` in the payload when the tree is too large to return at once.
+
+Args:
+    repo: Repository in ``owner/name`` form.
+    ref: Branch, tag, or tree SHA.
     github_token: Optional GitHub token for authenticated requests.
+    etag: ETag from a previous response, or ``None`` for an unconditional fetch.
 
 Returns:
-    Text content of the remote file.
+    ``(tree, etag)``. ``tree`` is ``None`` when the tree is unchanged.
+
+Raises:
+    ValueError: If the GitHub API request fails.
+
+Example:
+    >>> fetch_repo_tree_if_modified("nf-core/modules", "master", None, None)
+    ({'sha': '...', 'tree': [...], 'truncated': False}, 'W/"abc"')"""
+    ...
+
+def download_raw_file(
+    raw_url: str, dest: Path, github_token: str | None = None
+) -> None:
+    """Stream a raw file's bytes straight to disk.
+
+The body is copied in 64 KiB chunks, so memory stays flat regardless of the
+file size and no decode/encode round trip happens. Bytes go to a temporary
+file next to ``dest`` that is renamed into place once complete, so an
+interrupted download never leaves a truncated ``dest`` behind.
+
+Args:
+    raw_url: Raw GitHub URL for the file.
+    dest: Destination path on disk.
+    github_token: Optional GitHub token for authenticated requests.
 
 Raises:
     ValueError: If the file does not exist or the request fails.
 
 Example:
-    >>> fetch_raw_text("https://raw.githubusercontent.com/.../meta.yml")
-    'contents of meta.yml'"""
+    >>> download_raw_file("https://raw.githubusercontent.com/.../main.nf", Path("main.nf"))"""
+    ...
+
+def atomic_write_text(path: str | Path, text: str) -> None:
+    """Replace a file's contents through a temporary file and a rename.
+
+Concurrent readers see either the old or the new file, never a truncated
+one. No fsync: cached files can always be rebuilt.
+
+Args:
+    path: Destination path on disk.
+    text: Full text content to write.
+
+Example:
+    >>> atomic_write_text(Path("etags.json"), "{}")"""
     ...
 
 def fetch_rate_limit(github_token: str | None) -> dict[str, Any]:
@@ -57,16 +57,45 @@ def module_paths(cache_dir: Path, module_id: str) -> ModulePaths:
     """Return canonical local paths for a cached module."""
     ...
 
-def list_modules(cache_dir: Path, github_token: str | None) -> list[ModuleId]:
-    """List top-level modules, using a local cache when available."""
+def list_modules(
+    cache_dir: Path, github_token: str | None, *, refresh: bool = False
+) -> list[ModuleId]:
+    """List top-level modules, using a local cache when available.
+
+Results are memoized in-process per cache directory. With ``refresh=True``
+the listing is revalidated against GitHub using the stored ETag, so an
+unchanged catalog costs no rate-limited request. The on-disk list is
+revalidated the same way once it is older than an hour; if GitHub cannot
+be reached then, the stale list is returned and memoized like a fresh one."""
     ...
 
 def list_submodules(module_id: str, github_token: str | None) -> list[ModuleId]:
-    """List submodules under a given module id."""
+    """List submodules under a given module id (memoized in-process).
+
+Once the catalog tree has been fetched (``list_modules(refresh=True)`` or
+:func:`list_all_submodules`), answers come from memory without a request."""
+    ...
+
+def list_all_submodules(
+    cache_dir: Path, github_token: str | None
+) -> dict[ModuleId, list[ModuleId]]:
+    """Map every top-level module to its submodules.
+
+The whole catalog comes from a single recursive Git Trees request,
+revalidated with the stored ETag. Only when GitHub truncates the tree does
+this fall back to one contents listing per module.
+
+Example:
+    >>> list_all_submodules(Path("nf-core-modules"), None)["samtools"][:2]
+    ['ampliconclip', 'bam2fq']"""
     ...
 
 def get_rate_limit_status(github_token: str | None) -> dict:
-    """Return GitHub API rate limit status."""
+    """Return GitHub API rate limit status, reusing answers younger than 30 seconds."""
+    ...
+
+def clear_catalog_cache() -> None:
+    """Forget in-process memoized module listings and rate limit answers."""
     ...
 
 def ensure_module(
@@ -88,6 +117,28 @@ Returns:
     ``ModulePaths`` describing cached module files."""
     ...
 
+def ensure_modules(
+    cache_dir: Path,
+    module_ids: Sequence[ModuleId],
+    github_token: str | None,
+    *,
+    force: bool = False,
+) -> list[ModulePaths]:
+    """Ensure several nf-core modules are cached locally, downloading concurrently.
+
+Every missing file of every module goes through the shared download pool,
+which is what cache-warming needs.
+
+Args:
+    cache_dir: Directory for cached module artifacts.
+    module_ids: Module identifiers to cache.
+    github_token: Optional GitHub token for authenticated requests.
+    force: When ``True``, re-download even if cached.
+
+Returns:
+    ``ModulePaths`` for each module, in the order of ``module_ids``."""
+    ...
+
 def inspect_module(cache_dir: Path, module_id: ModuleId, github_token: str | None) -> dict:
     """Inspect module metadata and return a structured summary."""
     ...
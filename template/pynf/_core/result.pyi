@@ -44,6 +44,3 @@ def collect_paths_from_workdirs(task_workdirs: Sequence[str]) -> list[str]:
     """Collect visible files from task work directories."""
     ...
 
-def extend_unique(result_list: list[str], seen: set[str], values: Iterable[str]) -> None:
-    ...
-
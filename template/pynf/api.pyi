@@ -48,13 +48,16 @@ Example:
     ...
 
 def list_modules(
-    cache_dir: Path = DEFAULT_CACHE_DIR, github_token: str | None = None
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    github_token: str | None = None,
+    refresh: bool = False,
 ) -> list[str]:
     """List available modules, using cache when possible.
 
 Args:
     cache_dir: Cache directory for module metadata.
     github_token: Optional GitHub token for authenticated requests.
+    refresh: When ``True``, revalidate the cached list against GitHub.
 
 Returns:
     Sorted list of module identifiers.
@@ -79,6 +82,23 @@ Example:
     ['view', 'sort']"""
     ...
 
+def list_all_submodules(
+    cache_dir: Path = DEFAULT_CACHE_DIR, github_token: str | None = None
+) -> dict[ModuleId, list[str]]:
+    """Map every module to its submodules using a single GitHub request.
+
+Args:
+    cache_dir: Directory used to store the cached catalog ETag.
+    github_token: Optional GitHub token for authenticated requests.
+
+Returns:
+    Mapping of module identifier to its sorted submodule names.
+
+Example:
+    >>> list_all_submodules()["samtools"][:2]
+    ['ampliconclip', 'bam2fq']"""
+    ...
+
 def inspect_module(
     module_id: ModuleId,
     cache_dir: Path = DEFAULT_CACHE_DIR,
@@ -103,13 +103,16 @@ Args:
     github_token: Optional GitHub token for authenticated requests."""
     ...
 
-def list_modules_cmd(ctx: CLIContext, limit: Optional[int], rate_limit: bool):
+def list_modules_cmd(
+    ctx: CLIContext, limit: Optional[int], rate_limit: bool, refresh: bool
+):
     """List available nf-core modules.
 
 Args:
     ctx: Click context containing CLI configuration.
     limit: Optional number of modules to display.
-    rate_limit: When ``True``, display GitHub API rate limit info."""
+    rate_limit: When ``True``, display GitHub API rate limit info.
+    refresh: When ``True``, revalidate the cached module list."""
     ...
 
 def list_submodules(ctx: CLIContext, module: str):
@@ -120,12 +123,12 @@ Args:
     module: Parent module identifier."""
     ...
 
-def download(ctx: CLIContext, module: str, force: bool):
-    """Download an nf-core module into the local cache.
+def download(ctx: CLIContext, modules: tuple[str, ...], force: bool):
+    """Download one or more nf-core modules into the local cache.
 
 Args:
     ctx: Click context containing CLI configuration.
-    module: Module identifier to download.
+    modules: Module identifiers to download; several are fetched concurrently.
     force: When ``True``, re-download even if cached."""
     ...
 